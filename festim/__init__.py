@@ -21,6 +21,7 @@ k_B = 8.6173303e-5  # Boltzmann constant eV.K-1
 
 from .helpers import (
     update_expressions,
+    fast_ccode,
     kJmol_to_eV,
     extract_xdmf_labels,
     extract_xdmf_times,
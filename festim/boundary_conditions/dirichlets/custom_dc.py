@@ -1,4 +1,4 @@
-from festim import DirichletBC, BoundaryConditionExpression
+from festim import DirichletBC, BoundaryConditionExpression, fast_ccode
 import fenics as f
 import sympy as sp
 
@@ -47,4 +47,4 @@ class CustomDirichlet(DirichletBC):
             if isinstance(value, (int, float)):
                 self.prms[key] = f.Constant(value)
             else:
-                self.prms[key] = f.Expression(sp.printing.ccode(value), t=0, degree=1)
+                self.prms[key] = f.Expression(fast_ccode(value), t=0, degree=1)
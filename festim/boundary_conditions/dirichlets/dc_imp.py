@@ -1,4 +1,4 @@
-from festim import DirichletBC, BoundaryConditionExpression, k_B
+from festim import DirichletBC, BoundaryConditionExpression, k_B, fast_ccode
 import fenics as f
 import sympy as sp
 
@@ -69,11 +69,11 @@ class ImplantationDirichlet(DirichletBC):
         self.P = P
 
     def create_expression(self, T):
-        phi = f.Expression(sp.printing.ccode(self.phi), t=0, degree=1)
-        R_p = f.Expression(sp.printing.ccode(self.R_p), t=0, degree=1)
+        phi = f.Expression(fast_ccode(self.phi), t=0, degree=1)
+        R_p = f.Expression(fast_ccode(self.R_p), t=0, degree=1)
         sub_expressions = [phi, R_p]
         if self.P is not None:
-            P = f.Expression(sp.printing.ccode(self.P), t=0, degree=1)
+            P = f.Expression(fast_ccode(self.P), t=0, degree=1)
             sub_expressions.append(P)
         else:
             P = self.P
@@ -1,4 +1,4 @@
-from festim import BoundaryCondition, k_B
+from festim import BoundaryCondition, k_B, fast_ccode
 import fenics as f
 import sympy as sp
 
@@ -26,7 +26,7 @@ class DirichletBC(BoundaryCondition):
         Args:
             T (fenics.Function): temperature
         """
-        value_BC = sp.printing.ccode(self.value)
+        value_BC = fast_ccode(self.value)
         value_BC = f.Expression(value_BC, t=0, degree=4)
         # TODO : why degree 4?
 
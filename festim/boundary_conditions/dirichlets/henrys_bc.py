@@ -1,4 +1,4 @@
-from festim import DirichletBC, BoundaryConditionExpression, k_B
+from festim import DirichletBC, BoundaryConditionExpression, k_B, fast_ccode
 import fenics as f
 import sympy as sp
 
@@ -25,7 +25,7 @@ class HenrysBC(DirichletBC):
         self.pressure = pressure
 
     def create_expression(self, T):
-        pressure = f.Expression(sp.printing.ccode(self.pressure), t=0, degree=1)
+        pressure = f.Expression(fast_ccode(self.pressure), t=0, degree=1)
         value_BC = BoundaryConditionExpression(
             T,
             henrys_law,
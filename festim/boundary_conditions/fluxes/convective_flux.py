@@ -1,4 +1,4 @@
-from festim import FluxBC, k_B
+from festim import FluxBC, k_B, fast_ccode
 import fenics as f
 import sympy as sp
 
@@ -20,8 +20,8 @@ class ConvectiveFlux(FluxBC):
         super().__init__(surfaces=surfaces, field="T")
 
     def create_form(self, T, solute):
-        h_coeff = f.Expression(sp.printing.ccode(self.h_coeff), t=0, degree=1)
-        T_ext = f.Expression(sp.printing.ccode(self.T_ext), t=0, degree=1)
+        h_coeff = f.Expression(fast_ccode(self.h_coeff), t=0, degree=1)
+        T_ext = f.Expression(fast_ccode(self.T_ext), t=0, degree=1)
 
         self.form = -h_coeff * (T - T_ext)
         self.sub_expressions = [h_coeff, T_ext]
@@ -1,6 +1,8 @@
 from fenics import *
 import sympy as sp
 
+from festim import fast_ccode
+
 
 class Concentration:
     """Class for concentrations (solute or traps) with attributed
@@ -46,6 +48,6 @@ class Concentration:
             with XDMFFile(value) as f:
                 f.read_checkpoint(comp, label, time_step)
         else:
-            value = sp.printing.ccode(value)
+            value = fast_ccode(value)
             comp = Expression(value, degree=3, t=0)
         return comp
@@ -70,13 +70,16 @@ class Mobile(Concentration):
             if not isinstance(subdomains, list):
                 subdomains = [subdomains]  # make sure subdomains is a list
 
+            # computed once per material and reused in every subdomain term
+            # to keep the UFL tree (and the generated code) small
+            D = D_0 * exp(-E_D / k_B / T.T)
+
             # add to the formulation F for every subdomain
             for subdomain in subdomains:
                 dx = mesh.dx(subdomain)
                 # transient form
                 if dt is not None:
                     F += ((c_0 - c_0_n) / dt.value) * self.test_function * dx
-                D = D_0 * exp(-E_D / k_B / T.T)
                 if mesh.type == "cartesian":
                     F += dot(D * grad(c_0), grad(self.test_function)) * dx
                     if soret:
@@ -111,33 +114,23 @@ class Mobile(Concentration):
         if traps is not None:
             for trap in traps:
                 for i, mat in enumerate(trap.materials):
-                    if type(trap.k_0) is list:
-                        k_0 = trap.k_0[i]
-                        E_k = trap.E_k[i]
-                        p_0 = trap.p_0[i]
-                        E_p = trap.E_p[i]
-                        density = trap.density[i]
-                    else:
-                        k_0 = trap.k_0
-                        E_k = trap.E_k
-                        p_0 = trap.p_0
-                        E_p = trap.E_p
-                        density = trap.density[0]
+                    k_0, E_k, p_0, E_p, density = trap.get_material_properties(i)
                     c_m, _ = self.get_concentration_for_a_given_material(mat, T)
+                    # the Arrhenius exponentials are built once per material;
+                    # the minus sign stays on k_0 so the form tree is
+                    # unchanged
+                    exp_k = exp(-E_k / k_B / T.T)
+                    exp_p = exp(-E_p / k_B / T.T)
                     F_trapping += (
                         -k_0
-                        * exp(-E_k / k_B / T.T)
+                        * exp_k
                         * c_m
                         * (density - trap.solution)
                         * self.test_function
                         * dx(mat.id)
                     )
                     F_trapping += (
-                        p_0
-                        * exp(-E_p / k_B / T.T)
-                        * trap.solution
-                        * self.test_function
-                        * dx(mat.id)
+                        p_0 * exp_p * trap.solution * self.test_function * dx(mat.id)
                     )
         F += -F_trapping
 
@@ -188,8 +181,10 @@ class Mobile(Concentration):
                     # TODO : one day we will get rid of this huge expressions list
                     expressions_fluxes += bc.sub_expressions
 
+                    # same integrand on every surface of the bc
+                    flux_term = -self.test_function * bc.form
                     for surf in bc.surfaces:
-                        F += -self.test_function * bc.form * ds(surf)
+                        F += flux_term * ds(surf)
         self.F_fluxes = F
         self.F += F
         self.sub_expressions += expressions_fluxes
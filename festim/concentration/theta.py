@@ -12,6 +12,7 @@ class Theta(Mobile):
         super().__init__()
         self.S = None
         self.F = None
+        self._post_processing_solver = None
 
     def initialise(self, V, value, label=None, time_step=None):
         """Assign a value to self.previous_solution
@@ -88,14 +89,7 @@ class Theta(Mobile):
         The attribute post_processing_solution is fenics.Product (if self.S is
         festim.ArheniusCoeff)
         """
-        problem = f.LinearVariationalProblem(
-            a=f.lhs(self.form_post_processing),
-            L=f.rhs(self.form_post_processing),
-            u=self.post_processing_solution,
-            bcs=[],
-        )
-        solver = f.LinearVariationalSolver(problem)
-        solver.solve()
+        self._post_processing_solver.solve_global_rhs(self.post_processing_solution)
 
     def create_form_post_processing(self, V, materials, dx):
         """Creates a variational formulation for c = theta * S or theta**2 * S
@@ -120,3 +114,8 @@ class Theta(Mobile):
 
         self.form_post_processing = F
         self.post_processing_solution = f.Function(V)
+        # the DG1 mass matrix is block diagonal: the cell-local systems are
+        # factorised once here and only the right-hand side is re-assembled
+        # at each conversion
+        self._post_processing_solver = f.LocalSolver(f.lhs(F), f.rhs(F))
+        self._post_processing_solver.factorize()
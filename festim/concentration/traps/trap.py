@@ -1,4 +1,4 @@
-from festim import Concentration, k_B, Material, Theta, RadioactiveDecay
+from festim import Concentration, k_B, Material, Theta, RadioactiveDecay, fast_ccode
 from fenics import *
 import sympy as sp
 import numpy as np
@@ -94,9 +94,15 @@ class Trap(Concentration):
                 # if density is already a fenics Expression, use it as is
                 if isinstance(density, (Expression, UserExpression)):
                     self.density.append(density)
+                # if density is a constant, a fenics.Constant is enough and
+                # the sympy -> ccode -> JIT-compiled Expression is skipped
+                elif isinstance(density, (int, float, sp.Number)):
+                    self.density.append(
+                        Constant(float(density), name="density_{}_{}".format(self.id, i))
+                    )
                 # else assume it's a sympy expression
                 else:
-                    density_expr = sp.printing.ccode(density)
+                    density_expr = fast_ccode(density)
                     self.density.append(
                         Expression(
                             density_expr,
@@ -106,6 +112,27 @@ class Trap(Concentration):
                         )
                     )
 
+    def get_material_properties(self, index):
+        """Returns the trapping parameters and the density for the material
+        at the given index, handling both scalar and per-material list
+        values.
+
+        Args:
+            index (int): the index of the material in self.materials
+
+        Returns:
+            tuple: k_0, E_k, p_0, E_p, density
+        """
+        if type(self.k_0) is list:
+            return (
+                self.k_0[index],
+                self.E_k[index],
+                self.p_0[index],
+                self.E_p[index],
+                self.density[index],
+            )
+        return self.k_0, self.E_k, self.p_0, self.E_p, self.density[0]
+
     def create_form(self, mobile, materials, T, dx, dt=None):
         """Creates the general form associated with the trap
         d ct/ dt = k c_m (n - c_t) - p c_t + S
@@ -156,22 +183,12 @@ class Trap(Concentration):
                     F_trapping += solution * test_function * dx(mat.id)
 
         for i, mat in enumerate(self.materials):
-            if type(self.k_0) is list:
-                k_0 = self.k_0[i]
-                E_k = self.E_k[i]
-                p_0 = self.p_0[i]
-                E_p = self.E_p[i]
-                density = self.density[i]
-            else:
-                k_0 = self.k_0
-                E_k = self.E_k
-                p_0 = self.p_0
-                E_p = self.E_p
-                density = self.density[0]
+            k_0, E_k, p_0, E_p, density = self.get_material_properties(i)
 
             # add the density to the list of
-            # expressions to be updated
-            expressions_trap.append(density)
+            # expressions to be updated (constants don't need updating)
+            if isinstance(density, (Expression, UserExpression)):
+                expressions_trap.append(density)
 
             if isinstance(mobile, Theta) and mat.solubility_law == "henry":
                 raise NotImplementedError(
@@ -181,17 +198,14 @@ class Trap(Concentration):
             c_0, c_0_n = mobile.get_concentration_for_a_given_material(mat, T)
 
             # k(T)*c_m*(n - c_t) - p(T)*c_t
+            # the Arrhenius exponentials are built once per material; the
+            # minus sign stays on k_0 so the form tree is unchanged
+            exp_k = exp(-E_k / k_B / T.T)
+            exp_p = exp(-E_p / k_B / T.T)
             F_trapping += (
-                -k_0
-                * exp(-E_k / k_B / T.T)
-                * c_0
-                * (density - solution)
-                * test_function
-                * dx(mat.id)
-            )
-            F_trapping += (
-                p_0 * exp(-E_p / k_B / T.T) * solution * test_function * dx(mat.id)
+                -k_0 * exp_k * c_0 * (density - solution) * test_function * dx(mat.id)
             )
+            F_trapping += p_0 * exp_p * solution * test_function * dx(mat.id)
 
         self.F_trapping = F_trapping
         self.F += self.F_trapping
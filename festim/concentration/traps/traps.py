@@ -20,6 +20,8 @@ class Traps(list):
         self.F = None
         self.extrinsic_formulations = []
         self.sub_expressions = []
+        self._extrinsic_traps = []
+        self._density_vector_pairs = []
 
         # add ids if unspecified
         for i, trap in enumerate(self, 1):
@@ -86,11 +88,20 @@ class Traps(list):
 
     def initialise_extrinsic_traps(self, V):
         """Add functions to ExtrinsicTrapBase objects for density form"""
-        for trap in self:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
-                trap.density = [f.Function(V)]
-                trap.density_test_function = f.TestFunction(V)
-                trap.density_previous_solution = f.project(f.Constant(0), V)
+        self._extrinsic_traps = [
+            trap for trap in self if isinstance(trap, festim.ExtrinsicTrapBase)
+        ]
+        for trap in self._extrinsic_traps:
+            trap.density = [f.Function(V)]
+            trap.density_test_function = f.TestFunction(V)
+            trap.density_previous_solution = f.project(f.Constant(0), V)
+
+        # cache the (density, previous density) vector pairs so the per-step
+        # update doesn't re-check types or fetch the vectors again
+        self._density_vector_pairs = [
+            (trap.density[0].vector(), trap.density_previous_solution.vector())
+            for trap in self._extrinsic_traps
+        ]
 
     def define_variational_problem_extrinsic_traps(self, dx, dt, T):
         """
@@ -103,34 +114,30 @@ class Traps(list):
         """
         self.extrinsic_formulations = []
         expressions_extrinsic = []
-        for trap in self:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
-                trap.create_form_density(dx, dt, T)
-                self.extrinsic_formulations.append(trap.form_density)
+        for trap in self._extrinsic_traps:
+            trap.create_form_density(dx, dt, T)
+            self.extrinsic_formulations.append(trap.form_density)
+            # the problem and solver are built once and reused at every
+            # time step in solve_extrinsic_traps
+            du_t = f.TrialFunction(trap.density[0].function_space())
+            J_t = f.derivative(trap.form_density, trap.density[0], du_t)
+            problem = f.NonlinearVariationalProblem(
+                trap.form_density, trap.density[0], [], J_t
+            )
+            solver = f.NonlinearVariationalSolver(problem)
+            newton_solver_prm = solver.parameters["newton_solver"]
+            newton_solver_prm["absolute_tolerance"] = trap.absolute_tolerance
+            newton_solver_prm["relative_tolerance"] = trap.relative_tolerance
+            newton_solver_prm["maximum_iterations"] = trap.maximum_iterations
+            newton_solver_prm["linear_solver"] = trap.linear_solver
+            newton_solver_prm["preconditioner"] = trap.preconditioner
+            trap.density_solver = solver
         self.sub_expressions.extend(expressions_extrinsic)
 
     def solve_extrinsic_traps(self):
-        for trap in self:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
-                du_t = f.TrialFunction(trap.density[0].function_space())
-                J_t = f.derivative(trap.form_density, trap.density[0], du_t)
-                problem = f.NonlinearVariationalProblem(
-                    trap.form_density, trap.density[0], [], J_t
-                )
-                solver = f.NonlinearVariationalSolver(problem)
-                solver.parameters["newton_solver"][
-                    "absolute_tolerance"
-                ] = trap.absolute_tolerance
-                solver.parameters["newton_solver"][
-                    "relative_tolerance"
-                ] = trap.relative_tolerance
-                solver.parameters["newton_solver"][
-                    "maximum_iterations"
-                ] = trap.maximum_iterations
-                solver.parameters["newton_solver"]["linear_solver"] = trap.linear_solver
-                solver.solve()
+        for trap in self._extrinsic_traps:
+            trap.density_solver.solve()
 
     def update_extrinsic_traps_density(self):
-        for trap in self:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
-                trap.density_previous_solution.assign(trap.density[0])
+        for density, density_n in self._density_vector_pairs:
+            density_n[:] = density
@@ -27,6 +27,7 @@ class AverageSurface(SurfaceQuantity):
 
     def __init__(self, field, surface) -> None:
         super().__init__(field=field, surface=surface)
+        self._surface_area = None
 
     @property
     def title(self):
@@ -40,6 +41,13 @@ class AverageSurface(SurfaceQuantity):
             return quantity_title
 
     def compute(self):
-        return f.assemble(self.function * self.ds(self.surface)) / f.assemble(
-            1 * self.ds(self.surface)
-        )
+        if self._surface_area is None:
+            # the area of the surface doesn't change with time: assemble it
+            # once
+            self._surface_area = f.assemble(1 * self.ds(self.surface))
+        try:
+            form = self._forms[id(self.function)]
+        except KeyError:
+            form = f.Form(self.function * self.ds(self.surface))
+            self._forms[id(self.function)] = form
+        return self._assemble_scalar(form) / self._surface_area
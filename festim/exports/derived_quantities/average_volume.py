@@ -26,6 +26,7 @@ class AverageVolume(VolumeQuantity):
 
     def __init__(self, field, volume: int) -> None:
         super().__init__(field=field, volume=volume)
+        self._volume_size = None
 
     @property
     def title(self):
@@ -39,6 +40,13 @@ class AverageVolume(VolumeQuantity):
             return quantity_title
 
     def compute(self):
-        return f.assemble(self.function * self.dx(self.volume)) / f.assemble(
-            1 * self.dx(self.volume)
-        )
+        if self._volume_size is None:
+            # the volume of the subdomain doesn't change with time: assemble
+            # it once
+            self._volume_size = f.assemble(1 * self.dx(self.volume))
+        try:
+            form = self._forms[id(self.function)]
+        except KeyError:
+            form = f.Form(self.function * self.dx(self.volume))
+            self._forms[id(self.function)] = form
+        return self._assemble_scalar(form) / self._volume_size
@@ -4,6 +4,7 @@ from festim import (
     DerivedQuantity,
 )
 import fenics as f
+import csv
 import os
 import numpy as np
 from typing import Union
@@ -50,6 +51,7 @@ class DerivedQuantities(list):
 
         self.data = []
         self.t = []
+        self._rows_exported = 0
 
     @property
     def derived_quantities(self):
@@ -108,6 +110,9 @@ class DerivedQuantities(list):
             if not value.endswith(".csv"):
                 raise ValueError("filename must end with .csv")
         self._filename = value
+        # a new file must receive the full history, not just the rows added
+        # since the last export to the previous file
+        self._rows_exported = 0
 
     def make_header(self):
         header = ["t(s)"]
@@ -123,10 +128,12 @@ class DerivedQuantities(list):
 
     def assign_measures_to_quantities(self, dx, ds):
         self.volume_markers = dx.subdomain_data()
+        # the normal only depends on the mesh: build it once and share it
+        n = f.FacetNormal(dx.subdomain_data().mesh())
         for quantity in self:
             quantity.dx = dx
             quantity.ds = ds
-            quantity.n = f.FacetNormal(dx.subdomain_data().mesh())
+            quantity.n = n
 
     def assign_properties_to_quantities(self, materials):
         """Assign properties attributes to all DerivedQuantity objects
@@ -143,6 +150,10 @@ class DerivedQuantities(list):
 
     def compute(self, t):
         # TODO need to support for soret flag in surface flux
+        # check if first time writing data
+        if len(self.data) == 0:
+            self.data = [self.make_header()]
+
         row = [t]
         for quantity in self:
             if isinstance(quantity, (MaximumVolume, MinimumVolume)):
@@ -150,10 +161,6 @@ class DerivedQuantities(list):
             else:
                 value = quantity.compute()
 
-            # check if first time writing data
-            if len(self.data) == 0:
-                self.data = [self.make_header()]
-
             quantity.data.append(value)
             quantity.t.append(t)
             row.append(value)
@@ -168,8 +175,16 @@ class DerivedQuantities(list):
             if not os.path.exists(dirname):
                 os.makedirs(dirname, exist_ok=True)
 
-            # save the data to csv
-            np.savetxt(self.filename, np.array(self.data), fmt="%s", delimiter=",")
+            # if the data was reset since the last export, start a new file
+            if len(self.data) < self._rows_exported:
+                self._rows_exported = 0
+
+            # stream only the rows added since the last export rather than
+            # rewriting the whole history
+            mode = "a" if self._rows_exported else "w"
+            with open(self.filename, mode, newline="") as file:
+                csv.writer(file).writerows(self.data[self._rows_exported :])
+            self._rows_exported = len(self.data)
         return True
 
     def is_export(self, t, final_time, nb_iterations):
@@ -1,4 +1,6 @@
 from festim import Export
+import fenics as f
+import numpy as np
 
 
 class DerivedQuantity(Export):
@@ -9,6 +11,10 @@ class DerivedQuantity(Export):
         field (str, int):  the field ("solute", 0, 1, "T", "retention")
     """
 
+    # scalar tensor shared by all quantities: assembling into it avoids
+    # allocating a new scalar for every assemble call in the export loop
+    _scalar_tensor = None
+
     def __init__(self, field) -> None:
         super().__init__(field=field)
         self.dx = None
@@ -21,6 +27,25 @@ class DerivedQuantity(Export):
         self.data = []
         self.t = []
         self.show_units = False
+        # cache of compiled dolfin.Form objects keyed by the identity of
+        # their coefficients: the post-processing functions are updated in
+        # place, so the forms can be reused from one time step to the next
+        self._forms = {}
+
+    def _assemble_scalar(self, form):
+        """Assembles a rank-0 form into the shared scalar tensor and returns
+        its value
+
+        Args:
+            form (ufl.Form): the form to assemble
+
+        Returns:
+            float: the assembled value
+        """
+        if DerivedQuantity._scalar_tensor is None:
+            DerivedQuantity._scalar_tensor = f.Scalar()
+        f.assemble(form, tensor=DerivedQuantity._scalar_tensor)
+        return DerivedQuantity._scalar_tensor.get_scalar_value()
 
 
 class VolumeQuantity(DerivedQuantity):
@@ -35,6 +60,7 @@ class VolumeQuantity(DerivedQuantity):
     def __init__(self, field: str or int, volume: int) -> None:
         super().__init__(field)
         self.volume = volume
+        self._dofs_cache = {}
 
     @property
     def volume(self):
@@ -47,6 +73,42 @@ class VolumeQuantity(DerivedQuantity):
 
         self._volume = value
 
+    # cell-to-dof connectivity shared by all volume quantities, keyed by
+    # function space id
+    _connectivity_cache = {}
+
+    def volume_dofs(self, V, volume_markers):
+        """Returns the dofs of the cells marked with self.volume. The
+        indices only depend on the function space and the markers, so they
+        are computed once and cached. The cell-to-dof connectivity is built
+        a single time per function space and shared between quantities, so
+        extracting the dofs of a subdomain is a vectorised mask instead of
+        a Python loop over its cells.
+
+        Args:
+            V (fenics.FunctionSpace): the function space of the field
+            volume_markers (fenics.MeshFunction): markers of the mesh cells
+
+        Returns:
+            numpy.ndarray: the dof indices
+        """
+        key = (V.id(), volume_markers.id())
+        try:
+            return self._dofs_cache[key]
+        except KeyError:
+            try:
+                cell_dofs = VolumeQuantity._connectivity_cache[V.id()]
+            except KeyError:
+                dm = V.dofmap()
+                cell_dofs = np.array(
+                    [dm.cell_dofs(i) for i in range(V.mesh().num_cells())]
+                )
+                VolumeQuantity._connectivity_cache[V.id()] = cell_dofs
+            mask = volume_markers.array() == self.volume
+            subd_dofs = np.unique(cell_dofs[mask].ravel())
+            self._dofs_cache[key] = subd_dofs
+            return subd_dofs
+
 
 class SurfaceQuantity(DerivedQuantity):
     """DerivedQuantity relative to a surface
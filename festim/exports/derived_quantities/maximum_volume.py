@@ -1,5 +1,4 @@
 from festim import VolumeQuantity
-import fenics as f
 import numpy as np
 
 
@@ -40,18 +39,7 @@ class MaximumVolume(VolumeQuantity):
             return quantity_title
 
     def compute(self, volume_markers):
-        """Minimum of f over subdomains cells marked with self.volume"""
-        V = self.function.function_space()
-
-        dm = V.dofmap()
-
-        subd_dofs = np.unique(
-            np.hstack(
-                [
-                    dm.cell_dofs(c.index())
-                    for c in f.SubsetIterator(volume_markers, self.volume)
-                ]
-            )
-        )
+        """Maximum of f over subdomains cells marked with self.volume"""
+        subd_dofs = self.volume_dofs(self.function.function_space(), volume_markers)
 
         return np.max(self.function.vector().get_local()[subd_dofs])
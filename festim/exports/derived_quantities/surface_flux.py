@@ -62,27 +62,39 @@ class SurfaceFlux(SurfaceQuantity):
 
     @property
     def prop(self):
-        field_to_prop = {
-            "0": self.D,
-            "solute": self.D,
-            0: self.D,
-            "T": self.thermal_cond,
-        }
-        return field_to_prop[self.field]
+        # branch directly rather than building a dispatch dict at each call
+        if self.field == "T":
+            return self.thermal_cond
+        if self.field in (0, "0", "solute"):
+            return self.D
+        raise KeyError(self.field)
 
     def compute(self, soret=False):
-        flux = f.assemble(
-            self.prop * f.dot(f.grad(self.function), self.n) * self.ds(self.surface)
-        )
-        if soret and self.field in [0, "0", "solute"]:
-            flux += f.assemble(
-                self.prop
-                * self.function
-                * self.Q
-                / (k_B * self.T**2)
-                * f.dot(f.grad(self.T), self.n)
-                * self.ds(self.surface)
+        prop = self.prop
+        key = (id(prop), id(self.function))
+        try:
+            form = self._forms[key]
+        except KeyError:
+            form = f.Form(
+                prop * f.dot(f.grad(self.function), self.n) * self.ds(self.surface)
             )
+            self._forms[key] = form
+        flux = self._assemble_scalar(form)
+        if soret and self.field in [0, "0", "solute"]:
+            key = ("soret", id(prop), id(self.function), id(self.T))
+            try:
+                form = self._forms[key]
+            except KeyError:
+                form = f.Form(
+                    prop
+                    * self.function
+                    * self.Q
+                    / (k_B * self.T**2)
+                    * f.dot(f.grad(self.T), self.n)
+                    * self.ds(self.surface)
+                )
+                self._forms[key] = form
+            flux += self._assemble_scalar(form)
         return flux
 
 
@@ -152,7 +164,7 @@ class SurfaceFluxCylindrical(SurfaceFlux):
         # dS_r = r dz dtheta , assuming axisymmetry dS_r = theta r dz
         # in both cases the expression with self.ds is the same
 
-        flux = f.assemble(
+        flux = self._assemble_scalar(
             self.prop
             * self.r
             * f.dot(f.grad(self.function), self.n)
@@ -242,7 +254,7 @@ class SurfaceFluxSpherical(SurfaceFlux):
         # dS_r = r^2 sin(theta) dtheta dphi
         # integral(f dS_r) = integral(f r^2 sin(theta) dtheta dphi)
         #                  = (phi2 - phi1) * (-cos(theta2) + cos(theta1)) * f r^2
-        flux = f.assemble(
+        flux = self._assemble_scalar(
             self.prop
             * self.r**2
             * f.dot(f.grad(self.function), self.n)
@@ -49,4 +49,9 @@ class TotalSurface(SurfaceQuantity):
             return quantity_title
 
     def compute(self):
-        return f.assemble(self.function * self.ds(self.surface))
+        try:
+            form = self._forms[id(self.function)]
+        except KeyError:
+            form = f.Form(self.function * self.ds(self.surface))
+            self._forms[id(self.function)] = form
+        return self._assemble_scalar(form)
@@ -49,4 +49,9 @@ class TotalVolume(VolumeQuantity):
             return quantity_title
 
     def compute(self):
-        return f.assemble(self.function * self.dx(self.volume))
+        try:
+            form = self._forms[id(self.function)]
+        except KeyError:
+            form = f.Form(self.function * self.dx(self.volume))
+            self._forms[id(self.function)] = form
+        return self._assemble_scalar(form)
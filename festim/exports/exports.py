@@ -21,6 +21,8 @@ class Exports(list):
         self.V_DG1 = None
         self.final_time = None
         self.nb_iterations = 0
+        self._projectors = {}
+        self._grouped_exports = None
 
     @property
     def exports(self):
@@ -46,23 +48,49 @@ class Exports(list):
             ):
                 raise TypeError("exports must be a list of festim.Export")
             super().__init__(value)
+            self._grouped_exports = None
         else:
             raise TypeError("exports must be a list")
 
     def __setitem__(self, index, item):
         super().__setitem__(index, self._validate_export(item))
+        self._grouped_exports = None
 
     def insert(self, index, item):
         super().insert(index, self._validate_export(item))
+        self._grouped_exports = None
 
     def append(self, item):
         super().append(self._validate_export(item))
+        self._grouped_exports = None
 
     def extend(self, other):
         if isinstance(other, type(self)):
             super().extend(other)
         else:
             super().extend(self._validate_export(item) for item in other)
+        self._grouped_exports = None
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._grouped_exports = None
+
+    def remove(self, item):
+        super().remove(item)
+        self._grouped_exports = None
+
+    def pop(self, *args):
+        item = super().pop(*args)
+        self._grouped_exports = None
+        return item
+
+    def clear(self):
+        super().clear()
+        self._grouped_exports = None
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._grouped_exports = None
 
     def _validate_export(self, value):
         if isinstance(value, festim.Export) or isinstance(
@@ -71,6 +99,80 @@ class Exports(list):
             return value
         raise TypeError("festim.Exports must be a list of festim.Export")
 
+    def project_on_DG1(self, value):
+        """Projects a quantity on the V_DG1 function space with a cached
+        cell-local solver. The DG mass matrix is block diagonal so the
+        cell-local solve gives the same result as fenics.project without
+        assembling and solving a global system, and the factorisations are
+        reused from one time step to the next.
+
+        Args:
+            value (ufl.core.expr.Expr): the quantity to project
+
+        Returns:
+            fenics.Function: the projected function
+        """
+        if self.V_DG1 is None:
+            # without a target space (e.g. write() called on a model that
+            # wasn't initialised), let fenics.project infer one from the
+            # expression like before
+            return f.project(value, self.V_DG1)
+        try:
+            solver, u = self._projectors[value]
+        except KeyError:
+            v = f.TestFunction(self.V_DG1)
+            c = f.TrialFunction(self.V_DG1)
+            solver = f.LocalSolver(c * v * f.dx, value * v * f.dx)
+            solver.factorize()
+            u = f.Function(self.V_DG1)
+            self._projectors[value] = (solver, u)
+        solver.solve_global_rhs(u)
+        return u
+
+    def need_projecting(self, fields):
+        """Checks if an export both consumes one of the given fields and is
+        active at the current iteration.
+
+        Args:
+            fields (list): the field labels of interest
+
+        Returns:
+            bool: True if these fields need to be up to date at this step
+        """
+        for export in self:
+            if isinstance(export, festim.DerivedQuantities):
+                export_fields = [quantity.field for quantity in export]
+                active = export.is_compute(self.nb_iterations)
+            else:
+                export_fields = [export.field]
+                if isinstance(export, festim.XDMFExport) and self.t is not None:
+                    active = export.is_export(
+                        self.t, self.final_time, self.nb_iterations
+                    )
+                else:
+                    # TXTExport writes at every step
+                    active = True
+            if active and any(field in fields for field in export_fields):
+                return True
+        return False
+
+    def _group_exports(self):
+        """Classifies the exports by type, so that write() doesn't have to
+        re-dispatch on isinstance at every time step. The cache is
+        invalidated whenever the list is modified.
+        """
+        derived_quantities = []
+        xdmf_exports = []
+        txt_exports = []
+        for export in self:
+            if isinstance(export, festim.DerivedQuantities):
+                derived_quantities.append(export)
+            elif isinstance(export, festim.XDMFExport):
+                xdmf_exports.append(export)
+            elif isinstance(export, festim.TXTExport):
+                txt_exports.append(export)
+        self._grouped_exports = (derived_quantities, xdmf_exports, txt_exports)
+
     def write(self, label_to_function, dx):
         """writes to file
 
@@ -78,51 +180,57 @@ class Exports(list):
             label_to_function (dict): dictionary of labels mapped to solutions
             dx (fenics.Measure): the measure for dx
         """
-        for export in self:
-            if isinstance(export, festim.DerivedQuantities):
-                # compute derived quantities
-                if export.is_compute(self.nb_iterations):
-                    # check if function has to be projected
-                    for quantity in export:
-                        if isinstance(
-                            quantity, (festim.MaximumVolume, festim.MinimumVolume)
+        if self._grouped_exports is None:
+            self._group_exports()
+        derived_quantities_exports, xdmf_exports, txt_exports = self._grouped_exports
+
+        for export in derived_quantities_exports:
+            # compute derived quantities
+            if export.is_compute(self.nb_iterations):
+                # check if function has to be projected
+                for quantity in export:
+                    if isinstance(
+                        quantity, (festim.MaximumVolume, festim.MinimumVolume)
+                    ):
+                        if not isinstance(
+                            label_to_function[quantity.field], f.Function
                         ):
-                            if not isinstance(
-                                label_to_function[quantity.field], f.Function
-                            ):
-                                label_to_function[quantity.field] = f.project(
-                                    label_to_function[quantity.field], self.V_DG1
-                                )
-                        quantity.function = label_to_function[quantity.field]
-                    export.compute(self.t)
-                # export derived quantities
-                if export.is_export(self.t, self.final_time, self.nb_iterations):
-                    export.write()
-
-            elif isinstance(export, festim.XDMFExport):
-                if export.is_export(self.t, self.final_time, self.nb_iterations):
-                    if export.field == "retention":
-                        # if not a Function, project it onto V_DG1
-                        if not isinstance(label_to_function["retention"], f.Function):
-                            label_to_function["retention"] = f.project(
-                                label_to_function["retention"], self.V_DG1
+                            # materialise the field (e.g. the retention sum)
+                            # once with the cached projector: downstream
+                            # consumers then see a plain Function
+                            label_to_function[quantity.field] = self.project_on_DG1(
+                                label_to_function[quantity.field]
                             )
-                    export.function = label_to_function[export.field]
-                    if isinstance(export, festim.TrapDensityXDMF):
-                        export.write(self.t, dx)
-                    else:
-                        export.write(self.t)
-                    export.append = True
-
-            elif isinstance(export, festim.TXTExport):
-                # if not a Function, project it onto V_DG1
-                if not isinstance(label_to_function[export.field], f.Function):
-                    label_to_function[export.field] = f.project(
-                        label_to_function[export.field], self.V_DG1
-                    )
+                    quantity.function = label_to_function[quantity.field]
+                export.compute(self.t)
+            # export derived quantities
+            if export.is_export(self.t, self.final_time, self.nb_iterations):
+                export.write()
+
+        for export in xdmf_exports:
+            if export.is_export(self.t, self.final_time, self.nb_iterations):
+                if export.field == "retention":
+                    # if not a Function, project it onto V_DG1
+                    if not isinstance(label_to_function["retention"], f.Function):
+                        label_to_function["retention"] = self.project_on_DG1(
+                            label_to_function["retention"]
+                        )
                 export.function = label_to_function[export.field]
-                steady = self.final_time == None
-                export.write(self.t, steady)
+                if isinstance(export, festim.TrapDensityXDMF):
+                    export.write(self.t, dx)
+                else:
+                    export.write(self.t)
+                export.append = True
+
+        for export in txt_exports:
+            # if not a Function, project it onto V_DG1
+            if not isinstance(label_to_function[export.field], f.Function):
+                label_to_function[export.field] = self.project_on_DG1(
+                    label_to_function[export.field]
+                )
+            export.function = label_to_function[export.field]
+            steady = self.final_time == None
+            export.write(self.t, steady)
         self.nb_iterations += 1
 
     def initialise_derived_quantities(self, dx, ds, materials):
@@ -106,6 +106,10 @@ class Simulation:
         self.h_transport_problem = None
         self.t = 0  # Initialising time to 0s
         self.timer = None
+        self._next_progress_report = 0.0
+        self._last_progress_print = 0.0
+        self._need_projecting_solute = None
+        self._label_to_function_template = None
 
     @property
     def traps(self):
@@ -163,6 +167,9 @@ class Simulation:
             raise TypeError(
                 "accepted types for exports are list, festim.Export or festim.Exports"
             )
+        # the list changed: whether the solute needs projecting must be
+        # reassessed
+        self._need_projecting_solute = None
 
     def attribute_source_terms(self):
         """Assigns the source terms (in self.sources) to the correct field
@@ -202,7 +209,7 @@ class Simulation:
         self.T.boundary_conditions = []
         self.h_transport_problem.boundary_conditions = []
 
-        valid_fields = (
+        valid_fields = set(
             ["T", 0, "0"]  # temperature and mobile concentration
             + [str(i + 1) for i, _ in enumerate(self.traps)]
             + [i + 1 for i, _ in enumerate(self.traps)]
@@ -242,7 +249,14 @@ class Simulation:
         """
         set_log_level(self.log_level)
 
+        # enable FFC optimisations when generating code for the forms; the
+        # compiled forms are cached on disk by dijitso so the JIT cost is
+        # only paid the first time a given form is seen
+        parameters["form_compiler"]["optimize"] = True
+        parameters["form_compiler"]["cpp_optimize"] = True
+
         self.t = 0  # reinitialise t to zero
+        self._label_to_function_template = None
 
         if self.settings.chemical_pot:
             self.mobile = festim.Theta()
@@ -288,6 +302,19 @@ class Simulation:
         self.materials.create_properties(self.mesh.volume_markers, self.T.T)
         self.materials.create_solubility_law_markers(self.mesh)
 
+        # if the temperature is not time-dependent, the diffusivity can be
+        # projected once as a Function so that the derived quantities using
+        # it assemble without Python callbacks
+        if self.T.is_steady_state():
+            self.materials.diffusivity_as_function(self.mesh, self.T.T)
+        else:
+            # with a time-dependent temperature the diffusivity function is
+            # refreshed at each post-processing step with a vectorised
+            # numpy kernel (see update_diffusivity_function)
+            self.materials.create_diffusivity_function(
+                self.mesh, self.mesh.volume_markers
+            )
+
         # if the temperature is not time-dependent, solubility can be projected
         if self.settings.chemical_pot:
             # TODO this could be moved to Materials.create_properties()
@@ -342,6 +369,18 @@ class Simulation:
                         self.dt.milestones.append(time)
                 self.dt.milestones.sort()
 
+        # the answer is static for the lifetime of the simulation so it is
+        # computed once here instead of at every time step
+        self._need_projecting_solute = self.need_projecting_solute()
+
+    def invalidate_jacobian(self):
+        """Forces the Jacobian of the H transport problem to be recomputed
+        and the Newton solver to be rebuilt at the next solve. Call this
+        after changing the variational form or material coefficients of an
+        initialised model.
+        """
+        self.h_transport_problem.invalidate_jacobian()
+
     def run(self, completion_tone=False):
         """Runs the model.
 
@@ -375,6 +414,8 @@ class Simulation:
 
         #  Time-stepping
         print("Time stepping...")
+        self._next_progress_report = 0.0
+        self._last_progress_print = 0.0
         while self.t < self.settings.final_time and not np.isclose(
             self.t, self.settings.final_time, atol=0
         ):
@@ -414,31 +455,60 @@ class Simulation:
         # Post processing
         self.run_post_processing()
 
-        # avoid t > final_time
+        # avoid t > final_time; dt may have been adapted during the update
+        # so its value is read back once here
+        final_time = self.settings.final_time
         next_time = self.t + float(self.dt.value)
-        if next_time > self.settings.final_time:
-            self.dt.value.assign(self.settings.final_time - self.t)
+        if next_time > final_time:
+            self.dt.value.assign(final_time - self.t)
 
     def display_time(self):
-        """Displays the current time"""
-        simulation_percentage = round(self.t / self.settings.final_time * 100, 2)
-        elapsed_time = round(self.timer.elapsed()[0], 1)
-        msg = "{:.1f} %        ".format(simulation_percentage)
-        msg += "{:.1e} s".format(self.t)
-        msg += "    Elapsed time so far: {:.1f} s".format(elapsed_time)
-        if (
-            not np.isclose(self.t, self.settings.final_time, atol=0)
-            and self.log_level == 40
-        ):
+        """Displays the current time, at most every 0.1 % of progress and
+        every 0.2 s of wall-clock time, to avoid formatting and writing to
+        stdout at every single step"""
+        progress = self.t / self.settings.final_time
+        final_step = np.isclose(self.t, self.settings.final_time, atol=0)
+        if not final_step and progress < self._next_progress_report:
+            return
+        elapsed = self.timer.elapsed()[0]
+        if not final_step and elapsed - self._last_progress_print < 0.2:
+            return
+        self._next_progress_report = progress + 0.001
+        self._last_progress_print = elapsed
+        msg = (
+            f"{progress * 100:.1f} %        {self.t:.1e} s"
+            f"    Elapsed time so far: {elapsed:.1f} s"
+        )
+        if not final_step and self.log_level == 40:
             print(msg, end="\r")
         else:
             print(msg)
 
+    def need_projecting_solute(self):
+        """Checks if an export requires the mobile concentration (directly
+        or through the retention), in which case the conversion from theta
+        has to be performed when chemical_pot is True.
+
+        Returns:
+            bool: True if the mobile concentration is needed by an export
+        """
+        solute_fields = ["solute", "0", 0, "retention"]
+        for export in self.exports:
+            if isinstance(export, festim.DerivedQuantities):
+                fields = [quantity.field for quantity in export]
+            else:
+                fields = [export.field]
+            if any(field in solute_fields for field in fields):
+                return True
+        return False
+
     def run_post_processing(self):
         """Create post processing functions and compute/write the exports"""
+        self.exports.t = self.t
         self.update_post_processing_solutions()
+        # no-op unless the temperature is transient
+        self.materials.update_diffusivity_function(self.T.T)
 
-        self.exports.t = self.t
         self.exports.write(self.label_to_function, self.mesh.dx)
 
     def update_post_processing_solutions(self):
@@ -449,20 +519,42 @@ class Simulation:
             dict: a mapping of the field ("solute", "T", "retention") to its
             post_processsing_solution
         """
-        self.h_transport_problem.update_post_processing_solutions(self.exports)
-
-        label_to_function = {
-            "solute": self.mobile.post_processing_solution,
-            "0": self.mobile.post_processing_solution,
-            0: self.mobile.post_processing_solution,
-            "T": self.T.T,
-            "retention": sum(
-                [self.mobile.post_processing_solution]
-                + [trap.post_processing_solution for trap in self.traps]
-            ),
-        }
-        for trap in self.traps:
-            label_to_function[trap.id] = trap.post_processing_solution
-            label_to_function[str(trap.id)] = trap.post_processing_solution
+        # recompute the static answer if it was never computed or if the
+        # exports list was mutated (which also invalidates the grouping
+        # cache of Exports)
+        if (
+            self._need_projecting_solute is None
+            or self.exports._grouped_exports is None
+        ):
+            self._need_projecting_solute = self.need_projecting_solute()
+        # refine the static answer per step: the projection can be skipped
+        # at the iterations where no export consuming the solute is active
+        project_solute = self._need_projecting_solute and self.exports.need_projecting(
+            ["solute", "0", 0, "retention"]
+        )
+        self.h_transport_problem.update_post_processing_solutions(
+            self.exports, project_solute=project_solute
+        )
 
-        self.label_to_function = label_to_function
+        if self._label_to_function_template is None:
+            # the post-processing solutions are stable objects that follow
+            # the solution, so the mapping (including the retention sum) is
+            # built only once
+            label_to_function = {
+                "solute": self.mobile.post_processing_solution,
+                "0": self.mobile.post_processing_solution,
+                0: self.mobile.post_processing_solution,
+                "T": self.T.T,
+                "retention": sum(
+                    [self.mobile.post_processing_solution]
+                    + [trap.post_processing_solution for trap in self.traps]
+                ),
+            }
+            for trap in self.traps:
+                label_to_function[trap.id] = trap.post_processing_solution
+                label_to_function[str(trap.id)] = trap.post_processing_solution
+            self._label_to_function_template = label_to_function
+
+        # work on a fresh copy so that projections performed by the exports
+        # don't leak from one time step to the next
+        self.label_to_function = dict(self._label_to_function_template)
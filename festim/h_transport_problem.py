@@ -42,6 +42,9 @@ class HTransportProblem:
         self.V = None
         self.V_CG1 = None
         self.expressions = []
+        self.solver = None
+        self._post_processing_solutions = None
+        self._u_backup = None
 
     def initialise(self, mesh, materials, dt=None):
         """Assigns BCs, create suitable function space, initialise
@@ -78,6 +81,18 @@ class HTransportProblem:
         if self.settings.transient:
             self.traps.define_variational_problem_extrinsic_traps(mesh.dx, dt, self.T)
 
+        # collapse duplicates and drop objects without a t parameter
+        # (UserExpressions, Constants) so that the update loop in
+        # festim.update_expressions only touches each time-dependent
+        # expression once per time step
+        unique_expressions = []
+        known_ids = set()
+        for expression in self.expressions:
+            if id(expression) not in known_ids and hasattr(expression, "t"):
+                known_ids.add(id(expression))
+                unique_expressions.append(expression)
+        self.expressions = unique_expressions
+
     def define_function_space(self, mesh):
         """Creates a suitable function space for H transport problem
 
@@ -120,11 +135,12 @@ class HTransportProblem:
             self.mobile.previous_solution = self.u_n
             self.mobile.test_function = self.v
         else:
+            v_sub = split(self.v)  # split only once, not per concentration
             for i, concentration in enumerate([self.mobile, *self.traps]):
                 concentration.solution = self.u.sub(i)
                 # concentration.solution = list(split(self.u))[i]
                 concentration.previous_solution = self.u_n.sub(i)
-                concentration.test_function = list(split(self.v))[i]
+                concentration.test_function = v_sub[i]
 
         print("Defining initial values")
         field_to_component = {
@@ -135,6 +151,9 @@ class HTransportProblem:
         for i, trap in enumerate(self.traps, 1):
             field_to_component[trap.id] = i
             field_to_component[str(trap.id)] = i
+        # collapse() builds a brand new FunctionSpace so the result is
+        # cached per component
+        collapsed_subspaces = {}
         # TODO refactore this, attach the initial conditions to the objects directly
         for ini in self.initial_conditions:
             value = ini.value
@@ -142,8 +161,11 @@ class HTransportProblem:
 
             if self.V.num_sub_spaces() == 0:
                 functionspace = self.V
+            elif component in collapsed_subspaces:
+                functionspace = collapsed_subspaces[component]
             else:
                 functionspace = self.V.sub(component).collapse()
+                collapsed_subspaces[component] = functionspace
 
             if component == 0:
                 self.mobile.initialise(
@@ -159,6 +181,8 @@ class HTransportProblem:
         if self.settings.chemical_pot:
             if self.V.num_sub_spaces() == 0:
                 functionspace = self.V
+            elif 0 in collapsed_subspaces:
+                functionspace = collapsed_subspaces[0]
             else:
                 functionspace = self.V.sub(0).collapse()
             initial_guess = project(
@@ -168,9 +192,11 @@ class HTransportProblem:
         # this is needed to correctly create the formulation
         # TODO: write a test for this?
         if self.V.num_sub_spaces() != 0:
+            u_sub = split(self.u)
+            u_n_sub = split(self.u_n)
             for i, concentration in enumerate([self.mobile, *self.traps]):
-                concentration.previous_solution = list(split(self.u_n))[i]
-                concentration.solution = list(split(self.u))[i]
+                concentration.previous_solution = u_n_sub[i]
+                concentration.solution = u_sub[i]
 
     def define_variational_problem(self, materials, mesh, dt=None):
         """Creates the variational problem for hydrogen transport (form,
@@ -232,6 +258,15 @@ class HTransportProblem:
         du = TrialFunction(self.u.function_space())
         self.J = derivative(self.F, self.u, du)
 
+    def invalidate_jacobian(self):
+        """Forces the Jacobian and the Newton solver to be rebuilt at the
+        next solve. This is needed when the variational form or material
+        coefficients are modified after initialisation, since the solver
+        is otherwise built once and reused at every time step.
+        """
+        self.J = None
+        self.solver = None
+
     def update(self, t, dt):
         """Updates the H transport problem.
 
@@ -243,10 +278,14 @@ class HTransportProblem:
         festim.update_expressions(self.expressions, t)
 
         converged = False
-        u_ = Function(self.u.function_space())
-        u_.assign(self.u)
+        # the backup of the last converged solution is allocated once and
+        # reused at every step
+        if self._u_backup is None:
+            self._u_backup = Function(self.u.function_space())
+        u_ = self._u_backup
+        u_.vector()[:] = self.u.vector()
         while converged is False:
-            self.u.assign(u_)
+            self.u.vector()[:] = u_.vector()
             nb_it, converged = self.solve_once()
             if dt.adaptive_stepsize is not None or dt.milestones is not None:
                 dt.adapt(t, nb_it, converged)
@@ -265,44 +304,66 @@ class HTransportProblem:
                 converged else False
         """
 
+        if self.solver is None:
+            self.define_newton_solver()
+        nb_it, converged = self.solver.solve()
+
+        return nb_it, converged
+
+    def define_newton_solver(self):
+        """Creates the fenics.NonlinearVariationalSolver used by solve_once.
+        The problem and solver objects (and the underlying sparsity pattern)
+        are built once and reused at every time step.
+        """
         if self.J is None:  # Define the Jacobian
             du = TrialFunction(self.u.function_space())
             J = derivative(self.F, self.u, du)
         else:
             J = self.J
         problem = NonlinearVariationalProblem(self.F, self.u, self.bcs, J)
-        solver = NonlinearVariationalSolver(problem)
-        solver.parameters["newton_solver"]["error_on_nonconvergence"] = False
-        solver.parameters["newton_solver"][
-            "absolute_tolerance"
-        ] = self.settings.absolute_tolerance
-        solver.parameters["newton_solver"][
-            "relative_tolerance"
-        ] = self.settings.relative_tolerance
-        solver.parameters["newton_solver"][
-            "maximum_iterations"
-        ] = self.settings.maximum_iterations
-        solver.parameters["newton_solver"][
-            "linear_solver"
-        ] = self.settings.linear_solver
-        nb_it, converged = solver.solve()
-
-        return nb_it, converged
+        self.solver = NonlinearVariationalSolver(problem)
+        settings = self.settings
+        newton_solver_prm = self.solver.parameters["newton_solver"]
+        newton_solver_prm["error_on_nonconvergence"] = False
+        newton_solver_prm["absolute_tolerance"] = settings.absolute_tolerance
+        newton_solver_prm["relative_tolerance"] = settings.relative_tolerance
+        newton_solver_prm["maximum_iterations"] = settings.maximum_iterations
+        newton_solver_prm["linear_solver"] = settings.linear_solver
+        newton_solver_prm["preconditioner"] = settings.preconditioner
+        # only relevant with iterative linear solvers
+        if settings.krylov_absolute_tolerance is not None:
+            newton_solver_prm["krylov_solver"][
+                "absolute_tolerance"
+            ] = settings.krylov_absolute_tolerance
+        if settings.krylov_relative_tolerance is not None:
+            newton_solver_prm["krylov_solver"][
+                "relative_tolerance"
+            ] = settings.krylov_relative_tolerance
 
     def update_previous_solutions(self):
-        self.u_n.assign(self.u)
+        # raw vector copy: u and u_n live in the same function space so the
+        # compatibility checks (and projections) of Function.assign are
+        # not needed
+        self.u_n.vector()[:] = self.u.vector()
         self.traps.update_extrinsic_traps_density()
 
-    def update_post_processing_solutions(self, exports):
-        if self.u.function_space().num_sub_spaces() == 0:
-            res = [self.u]
-        else:
-            res = list(self.u.split())
+    def update_post_processing_solutions(self, exports, project_solute=True):
+        if self._post_processing_solutions is None:
+            # split only once: the sub functions are shallow copies that
+            # follow self.u
+            if self.u.function_space().num_sub_spaces() == 0:
+                self._post_processing_solutions = [self.u]
+            else:
+                self._post_processing_solutions = list(self.u.split())
+        res = self._post_processing_solutions
 
         for i, trap in enumerate(self.traps, 1):
             trap.post_processing_solution = res[i]
 
         if self.settings.chemical_pot:
-            self.mobile.post_processing_solution_to_concentration()
+            # the conversion from theta requires a projection, skip it if
+            # no export needs the mobile concentration
+            if project_solute:
+                self.mobile.post_processing_solution_to_concentration()
         else:
             self.mobile.post_processing_solution = res[0]
@@ -3,6 +3,34 @@ import xml.etree.ElementTree as ET
 from fenics import Expression, UserExpression, Constant
 import sympy as sp
 
+try:
+    import symengine
+except ImportError:
+    symengine = None
+
+
+def fast_ccode(expr):
+    """Converts a sympy expression to C99 code.
+
+    Uses symengine's printer when symengine is installed (it is much
+    faster than sympy's for sizable expressions), otherwise falls back
+    to sympy's.
+
+    Args:
+        expr (sp.Add, int, float): the expression to convert
+
+    Returns:
+        str: the C code
+    """
+    if symengine is not None:
+        try:
+            return symengine.ccode(symengine.sympify(expr))
+        except Exception:
+            # expression not supported by symengine (e.g. Piecewise
+            # variants), fall back to sympy
+            pass
+    return sp.printing.ccode(expr)
+
 
 def update_expressions(expressions, t):
     """Update all FEniCS Expression() in expressions.
@@ -23,7 +51,7 @@ def as_expression(expr):
         return expr
     # else assume it's a sympy expression
     else:
-        expr_ccode = sp.printing.ccode(expr)
+        expr_ccode = fast_ccode(expr)
         return Expression(expr_ccode, degree=2, t=0)
 
 
@@ -40,7 +68,7 @@ def as_constant_or_expression(val):
     elif isinstance(val, (int, float)):
         return Constant(val)
     else:
-        expr_ccode = sp.printing.ccode(val)
+        expr_ccode = fast_ccode(val)
         return Expression(expr_ccode, degree=2, t=0)
 
 
@@ -1,4 +1,5 @@
 from operator import itemgetter
+from math import exp
 import warnings
 import numpy as np
 from festim import k_B, Material, HeatTransferProblem
@@ -29,6 +30,14 @@ class Materials(list):
         self.density = None
         self.Q = None
 
+        # per-dof Arrhenius parameters for update_diffusivity_function
+        self._D_pre_exp = None
+        self._D_neg_E_over_kB = None
+        self._T_on_D_space = None
+
+        # lazy id to material mapping, invalidated when the list is modified
+        self._id_to_material = None
+
     @property
     def materials(self):
         warnings.warn(
@@ -47,23 +56,45 @@ class Materials(list):
             if not all(isinstance(t, festim.Material) for t in value):
                 raise TypeError("materials must be a list of festim.Material")
             super().__init__(value)
+            self._id_to_material = None
         else:
             raise TypeError("materials must be a list")
 
     def __setitem__(self, index, item):
         super().__setitem__(index, self._validate_material(item))
+        self._id_to_material = None
 
     def insert(self, index, item):
         super().insert(index, self._validate_material(item))
+        self._id_to_material = None
 
     def append(self, item):
         super().append(self._validate_material(item))
+        self._id_to_material = None
 
     def extend(self, other):
         if isinstance(other, type(self)):
             super().extend(other)
         else:
             super().extend(self._validate_material(item) for item in other)
+        self._id_to_material = None
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._id_to_material = None
+
+    def remove(self, item):
+        super().remove(item)
+        self._id_to_material = None
+
+    def pop(self, *args):
+        item = super().pop(*args)
+        self._id_to_material = None
+        return item
+
+    def clear(self):
+        super().clear()
+        self._id_to_material = None
 
     def _validate_material(self, value):
         if isinstance(value, festim.Material):
@@ -219,13 +250,22 @@ class Materials(list):
         Returns:
             festim.Material: the material that has the id mat_id
         """
-        for material in self:
-            mat_ids = material.id
-            if type(mat_ids) is not list:
-                mat_ids = [mat_ids]
-            if mat_id in mat_ids:
-                return material
-        raise ValueError("Couldn't find ID " + str(mat_id) + " in materials list")
+        if self._id_to_material is None:
+            # build the mapping once: the linear scan is then only paid on
+            # the first lookup instead of at every call
+            id_to_material = {}
+            for material in self:
+                mat_ids = material.id
+                if type(mat_ids) is not list:
+                    mat_ids = [mat_ids]
+                for existing_id in mat_ids:
+                    # keep the first match like the original linear scan
+                    id_to_material.setdefault(existing_id, material)
+            self._id_to_material = id_to_material
+        try:
+            return self._id_to_material[mat_id]
+        except KeyError:
+            raise ValueError("Couldn't find ID " + str(mat_id) + " in materials list")
 
     def find_material_from_name(self, name):
         """Returns the material with the correct name
@@ -311,19 +351,110 @@ class Materials(list):
         if self[0].Q is not None:
             self.Q = ThermalProp(self, vm, T, "Q", degree=2)
 
+    def diffusivity_as_function(self, mesh, T):
+        """
+        Makes diffusivity as a fenics.Function and stores it in D attribute.
+        Only valid when the temperature is time-independent: the derived
+        quantities using D then assemble entirely in compiled code instead
+        of calling the ArheniusCoeff UserExpression back into Python at
+        every quadrature point.
+        """
+        V = f.FunctionSpace(mesh.mesh, "DG", 1)
+        D = f.Function(V, name="D")
+        uD = f.TrialFunction(V)
+        vD = f.TestFunction(V)
+        dx = mesh.dx
+        a = uD * vD * dx
+        L = 0
+        for mat in self:
+            # make sure mat_ids is a list
+            mat_ids = mat.id
+            if not isinstance(mat.id, list):
+                mat_ids = [mat.id]
+            D_mat = mat.D_0 * f.exp(-mat.E_D / k_B / T)
+            for mat_id in mat_ids:
+                L += D_mat * vD * dx(mat_id)
+        # the projection on DG1 is cell-local: LocalSolver solves the
+        # cell-wise systems directly instead of a global solve
+        f.LocalSolver(a, L).solve_global_rhs(D)
+
+        self.D = D
+
+    def create_diffusivity_function(self, mesh, vm):
+        """
+        Makes diffusivity as a fenics.Function and stores it in the D
+        attribute, along with the per-dof Arrhenius parameters needed to
+        refresh it. Unlike diffusivity_as_function, this is valid for
+        time-dependent temperatures: update_diffusivity_function recomputes
+        the dof values with a single vectorised numpy expression instead of
+        calling the ArheniusCoeff UserExpression back into Python at every
+        quadrature point during assembly.
+
+        Args:
+            mesh (festim.Mesh): the mesh
+            vm (fenics.MeshFunction): the volume markers
+        """
+        V = f.FunctionSpace(mesh.mesh, "DG", 1)
+        D = f.Function(V, name="D")
+        dm = V.dofmap()
+        vm_array = vm.array()
+
+        nb_dofs = D.vector().local_size()
+        pre_exp = np.empty(nb_dofs)
+        neg_E_over_kB = np.empty(nb_dofs)
+        # DG dofs belong to a single cell: each dof inherits the Arrhenius
+        # parameters of the material marking its cell
+        coeffs = {}
+        for cell in f.cells(mesh.mesh):
+            subdomain_id = vm_array[cell.index()]
+            try:
+                D_0, E_term = coeffs[subdomain_id]
+            except KeyError:
+                material = self.find_material_from_id(subdomain_id)
+                D_0 = material.D_0
+                E_term = -material.E_D / k_B
+                coeffs[subdomain_id] = (D_0, E_term)
+            dofs = dm.cell_dofs(cell.index())
+            pre_exp[dofs] = D_0
+            neg_E_over_kB[dofs] = E_term
+
+        self.D = D
+        self._D_pre_exp = pre_exp
+        self._D_neg_E_over_kB = neg_E_over_kB
+        self._T_on_D_space = f.Function(V)
+
+    def update_diffusivity_function(self, T):
+        """Updates the diffusivity function from the current temperature.
+        Does nothing if create_diffusivity_function wasn't called.
+
+        Args:
+            T (fenics.Function): the temperature
+        """
+        if self._D_pre_exp is None:
+            return
+        self._T_on_D_space.interpolate(T)
+        T_values = self._T_on_D_space.vector().get_local()
+        self.D.vector().set_local(
+            self._D_pre_exp * np.exp(self._D_neg_E_over_kB / T_values)
+        )
+        self.D.vector().apply("insert")
+
     def solubility_as_function(self, mesh, T):
         """
         Makes solubility as a fenics.Function and stores it in S attribute
         """
         V = f.FunctionSpace(mesh.mesh, "DG", 1)
         S = f.Function(V, name="S")
+        uS = f.TrialFunction(V)
         vS = f.TestFunction(V)
         dx = mesh.dx
-        F = 0
+        a = uS * vS * dx
+        L = 0
         for mat in self:
-            F += -S * vS * dx(mat.id)
-            F += mat.S_0 * f.exp(-mat.E_S / k_B / T) * vS * dx(mat.id)
-        f.solve(F == 0, S, bcs=[])
+            L += mat.S_0 * f.exp(-mat.E_S / k_B / T) * vS * dx(mat.id)
+        # the projection on DG1 is cell-local: LocalSolver solves the
+        # cell-wise systems directly instead of a global solve
+        f.LocalSolver(a, L).solve_global_rhs(S)
 
         self.S = S
 
@@ -339,12 +470,24 @@ class Materials(list):
         henry = f.Function(V)
         sievert = f.Function(V)
 
-        test_function_henry = f.TestFunction(V)
-        test_function_sievert = f.TestFunction(V)
+        # if all materials follow the same solubility law the markers are
+        # uniform: fill the vectors directly and skip the two solves
+        laws = set(mat.solubility_law for mat in self)
+        if len(laws) == 1:
+            if laws.pop() == "henry":
+                henry.vector()[:] = 1.0
+            else:
+                sievert.vector()[:] = 1.0
+            self.henry_marker = henry
+            self.sievert_marker = sievert
+            return
+
+        # a single test function can be shared by both formulations
+        test_function = f.TestFunction(V)
 
         # initialise formulations
-        F_henry = -henry * test_function_henry * mesh.dx
-        F_sievert = -sievert * test_function_sievert * mesh.dx
+        F_henry = -henry * test_function * mesh.dx
+        F_sievert = -sievert * test_function * mesh.dx
 
         # build the formulation depending on the
         for mat in self:
@@ -355,9 +498,9 @@ class Materials(list):
 
             for mat_id in mat_ids:  # iterate through the subdomains
                 if mat.solubility_law == "henry":
-                    F_henry += 1 * test_function_henry * mesh.dx(mat_id)
+                    F_henry += 1 * test_function * mesh.dx(mat_id)
                 elif mat.solubility_law == "sievert":
-                    F_sievert += 1 * test_function_sievert * mesh.dx(mat_id)
+                    F_sievert += 1 * test_function * mesh.dx(mat_id)
 
         # solve the problems
         f.solve(F_henry == 0, henry, [])
@@ -371,18 +514,27 @@ class ArheniusCoeff(f.UserExpression):
     def __init__(self, materials, vm, T, pre_exp, E, **kwargs):
         super().__init__(kwargs)
         self._vm = vm
+        # the marker values are read straight from the underlying array,
+        # skipping the fenics.Cell construction at every point
+        self._vm_array = vm.array()
         self._T = T
         self._materials = materials
         self._pre_exp = pre_exp
         self._E = E
+        # cache of subdomain id -> (pre-exponential factor, -E/k_B) so that
+        # eval_cell only performs one division and one exp per point
+        self._coeffs = {}
 
     def eval_cell(self, value, x, ufc_cell):
-        cell = f.Cell(self._vm.mesh(), ufc_cell.index)
-        subdomain_id = self._vm[cell]
-        material = self._materials.find_material_from_id(subdomain_id)
-        D_0 = getattr(material, self._pre_exp)
-        E_D = getattr(material, self._E)
-        value[0] = D_0 * f.exp(-E_D / k_B / self._T(x))
+        subdomain_id = self._vm_array[ufc_cell.index]
+        try:
+            pre_exp, neg_E_over_kB = self._coeffs[subdomain_id]
+        except KeyError:
+            material = self._materials.find_material_from_id(subdomain_id)
+            pre_exp = getattr(material, self._pre_exp)
+            neg_E_over_kB = -getattr(material, self._E) / k_B
+            self._coeffs[subdomain_id] = (pre_exp, neg_E_over_kB)
+        value[0] = pre_exp * exp(neg_E_over_kB / self._T(x))
 
     def value_shape(self):
         return ()
@@ -393,14 +545,21 @@ class ThermalProp(f.UserExpression):
         super().__init__(kwargs)
         self._T = T
         self._vm = vm
+        self._vm_array = vm.array()
         self._materials = materials
         self._key = key
+        # cache of subdomain id -> material attribute, the material lookup
+        # is then only performed once per subdomain
+        self._attributes = {}
 
     def eval_cell(self, value, x, ufc_cell):
-        cell = f.Cell(self._vm.mesh(), ufc_cell.index)
-        subdomain_id = self._vm[cell]
-        material = self._materials.find_material_from_id(subdomain_id)
-        attribute = getattr(material, self._key)
+        subdomain_id = self._vm_array[ufc_cell.index]
+        try:
+            attribute = self._attributes[subdomain_id]
+        except KeyError:
+            material = self._materials.find_material_from_id(subdomain_id)
+            attribute = getattr(material, self._key)
+            self._attributes[subdomain_id] = attribute
         if callable(attribute):
             value[0] = attribute(self._T(x))
         else:
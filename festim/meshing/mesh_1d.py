@@ -1,4 +1,5 @@
 import fenics as f
+import numpy as np
 from festim import Mesh
 
 
@@ -39,15 +40,13 @@ class Mesh1D(Mesh):
             "size_t", self.mesh, self.mesh.topology().dim() - 1, 0
         )
         surface_markers.set_all(0)
-        i = 0
-        for facet in f.facets(self.mesh):
-            i += 1
-            x0 = facet.midpoint()
-            surface_markers[facet] = 0
-            if f.near(x0.x(), self.start):
-                surface_markers[facet] = 1
-            if f.near(x0.x(), self.size):
-                surface_markers[facet] = 2
+        # in 1D the facets are the mesh vertices, so all facet midpoints can
+        # be read at once from the coordinates array and the two boundaries
+        # marked with bulk assignments
+        x = self.mesh.coordinates()[:, 0]
+        values = surface_markers.array()
+        values[np.isclose(x, self.start, rtol=0, atol=f.DOLFIN_EPS)] = 1
+        values[np.isclose(x, self.size, rtol=0, atol=f.DOLFIN_EPS)] = 2
         return surface_markers
 
     def define_volume_markers(self, materials):
@@ -63,11 +62,32 @@ class Mesh1D(Mesh):
         volume_markers = f.MeshFunction(
             "size_t", self.mesh, self.mesh.topology().dim(), 0
         )
-        # iterate through the cells of the mesh and mark them
-        for cell in f.cells(self.mesh):
-            x = cell.midpoint().x()
-            subdomain_id = materials.find_subdomain_from_x_coordinate(x)
-            volume_markers[cell] = subdomain_id
+        # compute all cell midpoints at once and mark the cells in bulk,
+        # one vectorised comparison per border range rather than one
+        # find_subdomain_from_x_coordinate call per cell
+        midpoints = self.mesh.coordinates()[self.mesh.cells()].mean(axis=1).flatten()
+        subdomain_ids = np.zeros(midpoints.size, dtype=np.uintp)
+        for material in materials:
+            # if no borders are provided, assume only one subdomain
+            if material.borders is None:
+                subdomain_ids[:] = material.id
+                break
+            if isinstance(material.borders[0], list) and len(material.borders) > 1:
+                list_of_borders = material.borders
+            else:
+                list_of_borders = [material.borders]
+            if isinstance(material.id, list):
+                subdomains = material.id
+            else:
+                subdomains = [material.id for _ in range(len(list_of_borders))]
+
+            for borders, subdomain in zip(list_of_borders, subdomains):
+                mask = (borders[0] <= midpoints) & (midpoints <= borders[1])
+                # like find_subdomain_from_x_coordinate, the first matching
+                # material wins: only unmarked cells are assigned
+                mask &= subdomain_ids == 0
+                subdomain_ids[mask] = subdomain
+        volume_markers.set_values(subdomain_ids)
 
         return volume_markers
 
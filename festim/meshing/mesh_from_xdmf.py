@@ -9,6 +9,10 @@ class MeshFromXDMF(Mesh):
     Args:
         volume_file (str): path to the volume file
         boundary_file (str): path the boundary file
+        partitioner (str, optional): graph partitioner used to distribute
+            the mesh in parallel runs (eg. "SCOTCH", "ParMETIS"). Ignored
+            in serial runs where no partitioning takes place. Defaults to
+            None, the fenics default is then used.
 
     Attributes:
         volume_file (str): name of the volume file
@@ -16,31 +20,38 @@ class MeshFromXDMF(Mesh):
         mesh (fenics.Mesh): the mesh
     """
 
-    def __init__(self, volume_file, boundary_file, **kwargs) -> None:
+    def __init__(self, volume_file, boundary_file, partitioner=None, **kwargs) -> None:
         super().__init__(**kwargs)
 
         self.volume_file = volume_file
         self.boundary_file = boundary_file
 
+        if partitioner is not None and f.MPI.size(f.MPI.comm_world) > 1:
+            f.parameters["mesh_partitioner"] = partitioner
+
         self.mesh = f.Mesh()
-        f.XDMFFile(self.volume_file).read(self.mesh)
 
         self.define_markers()
 
     def define_markers(self):
-        """Reads volume and surface entities from XDMF files"""
+        """Reads the mesh and the volume and surface entities from XDMF
+        files"""
         mesh = self.mesh
 
-        # Read tags for volume elements
-        volume_markers = f.MeshFunction("size_t", mesh, mesh.topology().dim())
-        f.XDMFFile(self.volume_file).read(volume_markers)
+        # read the mesh and the tags for volume elements, opening and
+        # parsing the volume file only once
+        with f.XDMFFile(self.volume_file) as file:
+            file.read(mesh)
+            volume_markers = f.MeshFunction("size_t", mesh, mesh.topology().dim())
+            file.read(volume_markers)
 
         # Read tags for surface elements
         # (can also be used for applying DirichletBC)
         surface_markers = f.MeshValueCollection(
             "size_t", mesh, mesh.topology().dim() - 1
         )
-        f.XDMFFile(self.boundary_file).read(surface_markers, "f")
+        with f.XDMFFile(self.boundary_file) as file:
+            file.read(surface_markers, "f")
         surface_markers = f.MeshFunction("size_t", mesh, surface_markers)
 
         print("Succesfully load mesh with " + str(len(volume_markers)) + " cells")
@@ -25,6 +25,22 @@ class Settings:
             options can be veiwed by print(list_linear_solver_methods()).
             More information can be found at: https://fenicsproject.org/pub/tutorial/html/._ftut1017.html.
             Defaults to None, for the newton solver this is: "umfpack".
+            For large meshes the default direct solver can be the
+            bottleneck: an iterative method (eg. "gmres") combined with a
+            preconditioner (eg. "hypre_amg") usually scales much better on
+            the mixed solute/traps system.
+        preconditioner (str, optional): preconditioning method for the newton
+            solver, options can be viewed by print(list_krylov_solver_preconditioners()).
+            Defaults to "default".
+        krylov_absolute_tolerance (float, optional): the absolute tolerance
+            of the linear (krylov) solver within the newton solver. Only
+            used with iterative linear solvers. A loose tolerance avoids
+            over-solving the linear systems of the early newton iterations.
+            Defaults to None, the fenics default is then used.
+        krylov_relative_tolerance (float, optional): the relative tolerance
+            of the linear (krylov) solver within the newton solver. Only
+            used with iterative linear solvers. Defaults to None, the
+            fenics default is then used.
 
     Attributes:
         transient (bool): transient or steady state sim
@@ -40,6 +56,11 @@ class Settings:
         traps_element_type (str): Finite element used for traps.
         update_jacobian (bool):
         linear_solver (str): linear solver method for the newton solver
+        preconditioner (str): preconditioning method for the newton solver
+        krylov_absolute_tolerance (float): the absolute tolerance of the
+            linear (krylov) solver
+        krylov_relative_tolerance (float): the relative tolerance of the
+            linear (krylov) solver
     """
 
     def __init__(
@@ -54,6 +75,9 @@ class Settings:
         traps_element_type="CG",
         update_jacobian=True,
         linear_solver=None,
+        preconditioner="default",
+        krylov_absolute_tolerance=None,
+        krylov_relative_tolerance=None,
     ):
         # TODO maybe transient and final_time are redundant
         self.transient = transient
@@ -68,3 +92,6 @@ class Settings:
         self.traps_element_type = traps_element_type
         self.update_jacobian = update_jacobian
         self.linear_solver = linear_solver
+        self.preconditioner = preconditioner
+        self.krylov_absolute_tolerance = krylov_absolute_tolerance
+        self.krylov_relative_tolerance = krylov_relative_tolerance
@@ -1,6 +1,8 @@
 from fenics import Constant, Expression, Function, UserExpression
 import sympy as sp
 
+from festim import fast_ccode
+
 
 class Source:
     """
@@ -28,6 +30,6 @@ class Source:
         if isinstance(value, (float, int)):
             self.value = Constant(value)
         elif isinstance(value, sp.Expr):
-            self.value = Expression(sp.printing.ccode(value), t=0, degree=2)
+            self.value = Expression(fast_ccode(value), t=0, degree=2)
         elif isinstance(value, (Expression, UserExpression, Function)):
             self.value = value
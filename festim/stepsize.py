@@ -95,20 +95,27 @@ class Stepsize:
             dt_min = self.adaptive_stepsize["dt_min"]
             max_stepsize = self.adaptive_stepsize["max_stepsize"]
 
+            # read the Constant once and assign it back once: each
+            # float()/assign() crosses the fenics boundary
+            new_value = float(self.value)
             if not converged:
-                self.value.assign(float(self.value) / change_ratio)
-                if float(self.value) < dt_min:
+                # shrink and let the caller retry the step: the iteration
+                # count of a diverged solve is meaningless for the growth
+                # rule below
+                new_value /= change_ratio
+                if new_value < dt_min:
+                    self.value.assign(new_value)
                     raise ValueError("stepsize reached minimal value")
-            if nb_it < 5:
-                self.value.assign(float(self.value) * change_ratio)
+            elif nb_it < 5:
+                new_value *= change_ratio
             else:
-                self.value.assign(float(self.value) / change_ratio)
+                new_value /= change_ratio
 
             if callable(max_stepsize):
                 max_stepsize = max_stepsize(t)
             if max_stepsize is not None:
-                if float(self.value) > max_stepsize:
-                    self.value.assign(max_stepsize)
+                new_value = min(new_value, max_stepsize)
+            self.value.assign(new_value)
 
         # adapt for next milestone
         next_milestone = self.next_milestone(t)
@@ -1,6 +1,8 @@
 import sympy as sp
 import fenics as f
 
+from festim import fast_ccode
+
 
 class Temperature:
     """
@@ -36,8 +38,8 @@ class Temperature:
         V = f.FunctionSpace(mesh.mesh, "CG", 1)
         self.T = f.Function(V, name="T")
         self.T_n = f.Function(V, name="T_n")
-        self.expression = f.Expression(sp.printing.ccode(self.value), t=0, degree=2)
-        self.T.assign(f.interpolate(self.expression, V))
+        self.expression = f.Expression(fast_ccode(self.value), t=0, degree=2)
+        self.T.interpolate(self.expression)
         self.T_n.assign(self.T)
 
     def update(self, t):
@@ -46,9 +48,14 @@ class Temperature:
         Args:
             t (float): the time
         """
-        self.T_n.assign(self.T)
+        self.T_n.vector()[:] = self.T.vector()
         self.expression.t = t
-        self.T.assign(f.interpolate(self.expression, self.T.function_space()))
+        # interpolate in place rather than allocating a new Function
+        self.T.interpolate(self.expression)
 
     def is_steady_state(self):
-        return "t" not in sp.printing.ccode(self.value)
+        # inspecting the free symbols is much cheaper than generating the C
+        # code of the expression and looking for "t" in the string
+        return not any(
+            str(symbol) == "t" for symbol in sp.sympify(self.value).free_symbols
+        )
@@ -21,6 +21,9 @@ class HeatTransferProblem(festim.Temperature):
             If None, the default fenics linear solver will be used ("umfpack").
             More information can be found at: https://fenicsproject.org/pub/tutorial/html/._ftut1017.html.
             Defaults to None.
+        preconditioner (str, optional): preconditioning method for the newton
+            solver, options can be viewed by print(list_krylov_solver_preconditioners()).
+            Defaults to "default".
 
     Attributes:
         F (fenics.Form): the variational form of the heat transfer problem
@@ -31,6 +34,9 @@ class HeatTransferProblem(festim.Temperature):
         sources (list): contains festim.Source objects for volumetric heat
             sources
         boundary_conditions (list): contains festim.BoundaryConditions
+        solver (fenics.NonlinearVariationalSolver): the solver for the heat
+            transfer problem, built once at initialisation and reused at
+            every time step
     """
 
     def __init__(
@@ -41,6 +47,7 @@ class HeatTransferProblem(festim.Temperature):
         relative_tolerance=1e-10,
         maximum_iterations=30,
         linear_solver=None,
+        preconditioner="default",
     ) -> None:
         super().__init__()
         self.transient = transient
@@ -49,12 +56,14 @@ class HeatTransferProblem(festim.Temperature):
         self.relative_tolerance = relative_tolerance
         self.maximum_iterations = maximum_iterations
         self.linear_solver = linear_solver
+        self.preconditioner = preconditioner
 
         self.F = 0
         self.v_T = None
         self.sources = []
         self.boundary_conditions = []
         self.sub_expressions = []
+        self.solver = None
 
     # TODO rename initialise?
     def create_functions(self, materials, mesh, dt=None):
@@ -84,29 +93,36 @@ class HeatTransferProblem(festim.Temperature):
                             self.initial_condition.time_step,
                         )
             else:
-                ccode_T_ini = sp.printing.ccode(self.initial_condition.value)
+                ccode_T_ini = festim.fast_ccode(self.initial_condition.value)
                 self.initial_condition.value = f.Expression(ccode_T_ini, degree=2, t=0)
-                self.T_n.assign(f.interpolate(self.initial_condition.value, V))
+                # interpolate in place rather than allocating a new Function
+                self.T_n.interpolate(self.initial_condition.value)
 
         self.define_variational_problem(materials, mesh, dt)
         self.create_dirichlet_bcs(mesh.surface_markers)
+        self.define_newton_solver()
 
         if not self.transient:
             print("Solving stationary heat equation")
-            dT = f.TrialFunction(self.T.function_space())
-            JT = f.derivative(self.F, self.T, dT)
-            problem = f.NonlinearVariationalProblem(
-                self.F, self.T, self.dirichlet_bcs, JT
-            )
-            solver = f.NonlinearVariationalSolver(problem)
-            newton_solver_prm = solver.parameters["newton_solver"]
-            newton_solver_prm["absolute_tolerance"] = self.absolute_tolerance
-            newton_solver_prm["relative_tolerance"] = self.relative_tolerance
-            newton_solver_prm["maximum_iterations"] = self.maximum_iterations
-            newton_solver_prm["linear_solver"] = self.linear_solver
-            solver.solve()
+            self.solver.solve()
             self.T_n.assign(self.T)
 
+    def define_newton_solver(self):
+        """Creates the fenics.NonlinearVariationalSolver for the heat
+        transfer problem. The problem and solver objects are built once and
+        reused at every time step.
+        """
+        dT = f.TrialFunction(self.T.function_space())
+        JT = f.derivative(self.F, self.T, dT)  # Define the Jacobian
+        problem = f.NonlinearVariationalProblem(self.F, self.T, self.dirichlet_bcs, JT)
+        self.solver = f.NonlinearVariationalSolver(problem)
+        newton_solver_prm = self.solver.parameters["newton_solver"]
+        newton_solver_prm["absolute_tolerance"] = self.absolute_tolerance
+        newton_solver_prm["relative_tolerance"] = self.relative_tolerance
+        newton_solver_prm["maximum_iterations"] = self.maximum_iterations
+        newton_solver_prm["linear_solver"] = self.linear_solver
+        newton_solver_prm["preconditioner"] = self.preconditioner
+
     def define_variational_problem(self, materials, mesh, dt=None):
         """Create a variational form for heat transfer problem
 
@@ -180,8 +196,10 @@ class HeatTransferProblem(festim.Temperature):
                 # TODO: maybe that's not necessary
                 self.sub_expressions += bc.sub_expressions
 
+                # same integrand on every surface of the bc
+                flux_term = -bc.form * self.v_T
                 for surf in bc.surfaces:
-                    self.F += -bc.form * self.v_T * mesh.ds(surf)
+                    self.F += flux_term * mesh.ds(surf)
 
     def create_dirichlet_bcs(self, surface_markers):
         """Creates a list of fenics.DirichletBC and add time dependent
@@ -211,20 +229,9 @@ class HeatTransferProblem(festim.Temperature):
         """
         if self.transient:
             festim.update_expressions(self.sub_expressions, t)
-            # Solve heat transfers
-            dT = f.TrialFunction(self.T.function_space())
-            JT = f.derivative(self.F, self.T, dT)  # Define the Jacobian
-            problem = f.NonlinearVariationalProblem(
-                self.F, self.T, self.dirichlet_bcs, JT
-            )
-            solver = f.NonlinearVariationalSolver(problem)
-            newton_solver_prm = solver.parameters["newton_solver"]
-            newton_solver_prm["absolute_tolerance"] = self.absolute_tolerance
-            newton_solver_prm["relative_tolerance"] = self.relative_tolerance
-            newton_solver_prm["maximum_iterations"] = self.maximum_iterations
-            newton_solver_prm["linear_solver"] = self.linear_solver
-            solver.solve()
-            self.T_n.assign(self.T)
+            # Solve heat transfers with the solver built at initialisation
+            self.solver.solve()
+            self.T_n.vector()[:] = self.T.vector()
 
     def is_steady_state(self):
         return not self.transient
@@ -122,3 +122,73 @@ def test_solve_once_linear_solver_mumps():
 
     # test
     assert converged
+
+
+def test_solve_once_krylov_tolerances():
+    """Checks that solve_once() works with an iterative linear solver and
+    that the krylov tolerances are passed to the newton solver"""
+    # build
+    mesh = f.UnitIntervalMesh(8)
+    V = f.FunctionSpace(mesh, "CG", 1)
+
+    my_settings = festim.Settings(
+        absolute_tolerance=1e-10,
+        relative_tolerance=1e-10,
+        maximum_iterations=50,
+        linear_solver="gmres",
+        krylov_absolute_tolerance=1e-13,
+        krylov_relative_tolerance=1e-12,
+    )
+    my_problem = festim.HTransportProblem(
+        festim.Mobile(), festim.Traps([]), festim.Temperature(200), my_settings, []
+    )
+    my_problem.u = f.Function(V)
+    my_problem.u_n = f.Function(V)
+    my_problem.v = f.TestFunction(V)
+    my_problem.F = (
+        (my_problem.u - my_problem.u_n) * my_problem.v * f.dx
+        + 1 * my_problem.v * f.dx
+        + f.dot(f.grad(my_problem.u), f.grad(my_problem.v)) * f.dx
+    )
+    # run
+    nb_it, converged = my_problem.solve_once()
+
+    # test
+    assert converged
+    krylov_prm = my_problem.solver.parameters["newton_solver"]["krylov_solver"]
+    assert krylov_prm["absolute_tolerance"] == 1e-13
+    assert krylov_prm["relative_tolerance"] == 1e-12
+
+
+def test_solve_once_preconditioner():
+    """Checks that solve_once() works when an alternative preconditioner is
+    used rather than the default"""
+    # build
+    mesh = f.UnitIntervalMesh(8)
+    V = f.FunctionSpace(mesh, "CG", 1)
+
+    my_settings = festim.Settings(
+        absolute_tolerance=1e-10,
+        relative_tolerance=1e-10,
+        maximum_iterations=50,
+        linear_solver="gmres",
+        preconditioner="icc",
+    )
+    my_problem = festim.HTransportProblem(
+        festim.Mobile(), festim.Traps([]), festim.Temperature(200), my_settings, []
+    )
+    my_problem.u = f.Function(V)
+    my_problem.u_n = f.Function(V)
+    my_problem.v = f.TestFunction(V)
+    my_problem.F = (
+        (my_problem.u - my_problem.u_n) * my_problem.v * f.dx
+        + 1 * my_problem.v * f.dx
+        + f.dot(f.grad(my_problem.u), f.grad(my_problem.v)) * f.dx
+    )
+    # run
+    nb_it, converged = my_problem.solve_once()
+
+    # test
+    assert converged
+    newton_prm = my_problem.solver.parameters["newton_solver"]
+    assert newton_prm["preconditioner"] == "icc"
@@ -5,10 +5,13 @@ from festim import (
     as_constant,
     as_expression,
     as_constant_or_expression,
+    fast_ccode,
     t,
 )
+import festim
 from fenics import Constant, Expression, UserExpression
 import pytest
+import sympy as sp
 
 
 def test_energy_converter():
@@ -61,3 +64,13 @@ def test_as_expression(expression, type):
 )
 def test_as_constant_or_expression(expression, type):
     assert isinstance(as_constant_or_expression(expression), type)
+
+
+def test_fast_ccode_sympy_fallback(monkeypatch):
+    """Checks that fast_ccode produces sympy's ccode when symengine
+    isn't available"""
+    monkeypatch.setattr(festim.helpers, "symengine", None)
+
+    expr = 2 + sp.cos(t) * t**2
+
+    assert fast_ccode(expr) == sp.printing.ccode(expr)